@@ -1,7 +1,39 @@
-from .api import batchify as batchify
+import typing as t
+
 from .exceptions import DryRunEarlyExit as DryRunEarlyExit
 
+if t.TYPE_CHECKING:
+    from .api import batchify as batchify
+
 __all__ = [
     "batchify",
     "DryRunEarlyExit",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    """
+    Resolve ``batchify`` on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name looked up on the package.
+
+    Returns
+    -------
+    typing.Any
+        The ``batchify`` function.
+
+    Notes
+    -----
+    ``batchling.api`` pulls in the batcher, hooks, providers and HTTP clients, so
+    importing a lightweight submodule (e.g. ``batchling.exceptions`` from the CLI)
+    does not pay for it until ``batchify`` is actually used.
+    """
+    if name == "batchify":
+        from .api import batchify
+
+        globals()["batchify"] = batchify
+        return batchify
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
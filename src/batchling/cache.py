@@ -4,16 +4,25 @@ Persistent cache store for request-to-batch mappings.
 
 from __future__ import annotations
 
+import functools
 import os
 import sqlite3
+import threading
 import typing as t
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 
 CACHE_PATH_ENV_VAR = "BATCHLING_CACHE_PATH"
+# Conservative bound on bound parameters per statement (SQLite < 3.32 default).
+_SQLITE_MAX_VARIABLES = 999
+_ENTRY_COLUMN_COUNT = 9
+_UPSERT_CHUNK_SIZE = _SQLITE_MAX_VARIABLES // _ENTRY_COLUMN_COUNT
+_ENTRY_ROW_PLACEHOLDER = "(" + ", ".join(["?"] * _ENTRY_COLUMN_COUNT) + ")"
+ENTRY_MEMORY_CACHE_SIZE = 4096
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CacheEntry:
     """
     Cache row used to resume batch polling from an intercepted request.
@@ -51,6 +60,51 @@ class CacheEntry:
     created_at: float
 
 
+@functools.lru_cache(maxsize=8)
+def _build_upsert_query(*, row_count: int) -> str:
+    """
+    Build a multi-row upsert statement for ``request_cache``.
+
+    Parameters
+    ----------
+    row_count : int
+        Number of ``VALUES`` rows in the statement.
+
+    Returns
+    -------
+    str
+        Upsert SQL with ``row_count`` placeholder rows.
+
+    Notes
+    -----
+    Full chunks always share one statement text, so SQLite's per-connection
+    statement cache reuses the compiled statement across calls.
+    """
+    values = ", ".join([_ENTRY_ROW_PLACEHOLDER] * row_count)
+    return f"""
+        INSERT INTO request_cache (
+            request_hash,
+            provider,
+            endpoint,
+            model,
+            host,
+            batch_id,
+            custom_id,
+            request_count,
+            created_at
+        ) VALUES {values}
+        ON CONFLICT(request_hash) DO UPDATE SET
+            provider=excluded.provider,
+            endpoint=excluded.endpoint,
+            model=excluded.model,
+            host=excluded.host,
+            batch_id=excluded.batch_id,
+            custom_id=excluded.custom_id,
+            request_count=excluded.request_count,
+            created_at=excluded.created_at
+    """  # nosec B608
+
+
 def resolve_cache_path(*, path: Path | None = None) -> Path:
     """
     Resolve cache database path.
@@ -91,6 +145,9 @@ class RequestCacheStore:
         """
         self._path = resolve_cache_path(path=path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection: sqlite3.Connection | None = None
+        self._memory_entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
         self._initialize_schema()
 
     @property
@@ -107,16 +164,40 @@ class RequestCacheStore:
 
     def _connect(self) -> sqlite3.Connection:
         """
-        Open a SQLite connection to the cache file.
+        Return the store's SQLite connection, opening it on first use.
 
         Returns
         -------
         sqlite3.Connection
             Open connection.
+
+        Notes
+        -----
+        One connection is kept for the lifetime of the store since a lookup runs
+        for every intercepted request. It is opened in WAL mode with
+        ``synchronous=NORMAL`` so readers do not block on writers and commits
+        skip the per-transaction fsync of the rollback journal. Public operations
+        hold ``_lock`` while using it, so writes may run in a worker thread.
         """
-        connection = sqlite3.connect(self._path.as_posix())
-        connection.row_factory = sqlite3.Row
-        return connection
+        if self._connection is None:
+            connection = sqlite3.connect(self._path.as_posix(), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Close the underlying SQLite connection.
+
+        Notes
+        -----
+        The store stays usable: the next operation reopens the connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     def _initialize_schema(self) -> None:
         """
@@ -139,9 +220,8 @@ class RequestCacheStore:
                 """
             )
             table_columns = connection.execute("PRAGMA table_info(request_cache)").fetchall()
-            has_request_count = any(
-                str(column["name"]) == "request_count" for column in table_columns
-            )
+            # ``PRAGMA table_info`` rows are ``(cid, name, type, notnull, dflt_value, pk)``.
+            has_request_count = any(str(column[1]) == "request_count" for column in table_columns)
             if not has_request_count:
                 connection.execute(
                     """
@@ -167,34 +247,28 @@ class RequestCacheStore:
                 ON request_cache (created_at)
                 """
             )
-            connection.commit()
 
     @staticmethod
-    def _row_to_entry(*, row: sqlite3.Row) -> CacheEntry:
+    def _row_to_entry(*, row: tuple[t.Any, ...]) -> CacheEntry:
         """
         Map one SQLite row to a cache entry.
 
         Parameters
         ----------
-        row : sqlite3.Row
-            Database row from ``request_cache``.
+        row : tuple[typing.Any, ...]
+            Database row from ``request_cache``, selected in ``CacheEntry`` field order.
 
         Returns
         -------
         CacheEntry
             Parsed cache entry.
+
+        Notes
+        -----
+        Rows are plain tuples (no ``row_factory``) and column affinities already
+        yield ``str``/``int``/``float`` values, so fields are passed positionally.
         """
-        return CacheEntry(
-            request_hash=str(row["request_hash"]),
-            provider=str(row["provider"]),
-            endpoint=str(row["endpoint"]),
-            model=str(row["model"]),
-            host=str(row["host"]),
-            batch_id=str(row["batch_id"]),
-            custom_id=str(row["custom_id"]),
-            request_count=int(row["request_count"]),
-            created_at=float(row["created_at"]),
-        )
+        return CacheEntry(*row)
 
     @staticmethod
     def _entry_values(*, entry: CacheEntry) -> tuple[str, str, str, str, str, str, str, int, float]:
@@ -236,30 +310,59 @@ class RequestCacheStore:
         -------
         CacheEntry | None
             Matching row when found.
+
+        Notes
+        -----
+        Found rows are kept in a bounded in-memory LRU that writes and deletes
+        through this store invalidate. Memoized hits are not revalidated against
+        other writers: once a hash is in memory, updates or deletes of that row by
+        another store (another scope or process sharing the file) are not seen by
+        this store. Misses are not remembered, so rows first inserted by other
+        writers are still picked up on the next lookup.
+
+        Memory hits are served without ``_lock``, so a lookup on the event loop
+        never waits for a commit running in a worker thread. Misses query SQLite
+        under ``_lock`` and can wait for an in-flight ``upsert_many`` or delete
+        to finish.
         """
-        with self._connect() as connection:
-            row = connection.execute(
-                """
-                SELECT
-                    request_hash,
-                    provider,
-                    endpoint,
-                    model,
-                    host,
-                    batch_id,
-                    custom_id,
-                    request_count,
-                    created_at
-                FROM request_cache
-                WHERE request_hash = ?
-                """,
-                (request_hash,),
-            ).fetchone()
-
-        if row is None:
-            return None
-
-        return self._row_to_entry(row=row)
+        memory_entries = self._memory_entries
+        entry = memory_entries.get(request_hash)
+        if entry is not None:
+            try:
+                memory_entries.move_to_end(key=request_hash)
+            except KeyError:
+                # Invalidated by a concurrent write after the read above.
+                pass
+            return entry
+
+        with self._lock:
+            with self._connect() as connection:
+                row = connection.execute(
+                    """
+                    SELECT
+                        request_hash,
+                        provider,
+                        endpoint,
+                        model,
+                        host,
+                        batch_id,
+                        custom_id,
+                        request_count,
+                        created_at
+                    FROM request_cache
+                    WHERE request_hash = ?
+                    """,
+                    (request_hash,),
+                ).fetchone()
+
+            if row is None:
+                return None
+
+            entry = self._row_to_entry(row=row)
+            memory_entries[request_hash] = entry
+            if len(memory_entries) > ENTRY_MEMORY_CACHE_SIZE:
+                memory_entries.popitem(last=False)
+            return entry
 
     def upsert_many(self, *, entries: t.Sequence[CacheEntry]) -> int:
         """
@@ -278,35 +381,20 @@ class RequestCacheStore:
         if not entries:
             return 0
 
-        with self._connect() as connection:
-            connection.executemany(
-                """
-                INSERT INTO request_cache (
-                    request_hash,
-                    provider,
-                    endpoint,
-                    model,
-                    host,
-                    batch_id,
-                    custom_id,
-                    request_count,
-                    created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(request_hash) DO UPDATE SET
-                    provider=excluded.provider,
-                    endpoint=excluded.endpoint,
-                    model=excluded.model,
-                    host=excluded.host,
-                    batch_id=excluded.batch_id,
-                    custom_id=excluded.custom_id,
-                    request_count=excluded.request_count,
-                    created_at=excluded.created_at
-                """,
-                [self._entry_values(entry=entry) for entry in entries],
-            )
-            affected = connection.total_changes
-            connection.commit()
-        return affected
+        with self._lock:
+            for entry in entries:
+                self._memory_entries.pop(entry.request_hash, None)
+
+            connection = self._connect()
+            changes_before = connection.total_changes
+            with connection:
+                for start in range(0, len(entries), _UPSERT_CHUNK_SIZE):
+                    chunk = entries[start : start + _UPSERT_CHUNK_SIZE]
+                    connection.execute(
+                        _build_upsert_query(row_count=len(chunk)),
+                        [value for entry in chunk for value in self._entry_values(entry=entry)],
+                    )
+            return connection.total_changes - changes_before
 
     def delete_older_than(self, *, min_created_at: float) -> int:
         """
@@ -322,14 +410,23 @@ class RequestCacheStore:
         int
             Number of deleted rows.
         """
-        with self._connect() as connection:
-            cursor = connection.execute(
-                "DELETE FROM request_cache WHERE created_at < ?",
-                (min_created_at,),
-            )
-            deleted_count = cursor.rowcount if cursor.rowcount is not None else 0
-            connection.commit()
-        return deleted_count
+        with self._lock:
+            # Snapshot first: lock-free hits in ``get_by_hash`` may reorder the LRU.
+            stale_hashes = [
+                request_hash
+                for request_hash, entry in tuple(self._memory_entries.items())
+                if entry.created_at < min_created_at
+            ]
+            for request_hash in stale_hashes:
+                del self._memory_entries[request_hash]
+
+            with self._connect() as connection:
+                cursor = connection.execute(
+                    "DELETE FROM request_cache WHERE created_at < ?",
+                    (min_created_at,),
+                )
+                deleted_count = cursor.rowcount if cursor.rowcount is not None else 0
+            return deleted_count
 
     def delete_by_hashes(self, *, request_hashes: t.Iterable[str]) -> int:
         """
@@ -345,17 +442,23 @@ class RequestCacheStore:
         int
             Number of deleted rows.
         """
-        unique_hashes = tuple(dict.fromkeys(request_hashes))
+        unique_hashes = tuple(set(request_hashes))
         if not unique_hashes:
             return 0
 
-        placeholders = ", ".join(["?"] * len(unique_hashes))
-        query = f"DELETE FROM request_cache WHERE request_hash IN ({placeholders})"  # nosec B608
-        with self._connect() as connection:
-            cursor = connection.execute(
-                query,
-                unique_hashes,
-            )
-            deleted_count = cursor.rowcount if cursor.rowcount is not None else 0
-            connection.commit()
-        return deleted_count
+        with self._lock:
+            for request_hash in unique_hashes:
+                self._memory_entries.pop(request_hash, None)
+
+            deleted_count = 0
+            with self._connect() as connection:
+                for start in range(0, len(unique_hashes), _SQLITE_MAX_VARIABLES):
+                    chunk = unique_hashes[start : start + _SQLITE_MAX_VARIABLES]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    query = f"DELETE FROM request_cache WHERE request_hash IN ({placeholders})"  # nosec B608
+                    cursor = connection.execute(
+                        query,
+                        chunk,
+                    )
+                    deleted_count += cursor.rowcount if cursor.rowcount is not None else 0
+            return deleted_count
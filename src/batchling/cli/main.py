@@ -1,14 +1,17 @@
 import asyncio
 import inspect
 import runpy
+import stat
 import typing as t
 from pathlib import Path
 
 import typer
 
-from batchling import batchify
 from batchling.exceptions import DryRunEarlyExit
 
+if t.TYPE_CHECKING:
+    from batchling.context import BatchingContext
+
 # syncify = lambda f: wraps(f)(lambda *args, **kwargs: asyncio.run(f(*args, **kwargs)))
 
 
@@ -20,6 +23,30 @@ app = typer.Typer(
 )
 
 
+def batchify(**kwargs: t.Any) -> "BatchingContext":
+    """
+    Import and call ``batchling.batchify``.
+
+    Parameters
+    ----------
+    **kwargs : typing.Any
+        Keyword arguments forwarded to ``batchling.batchify``.
+
+    Returns
+    -------
+    BatchingContext
+        Context manager returned by ``batchling.batchify``.
+
+    Notes
+    -----
+    The import is deferred so ``batchling --help`` and argument errors do not
+    load the batcher, hooks and provider modules.
+    """
+    from batchling.api import batchify as api_batchify
+
+    return api_batchify(**kwargs)
+
+
 def parse_function_call_args(script_args: list[str]) -> tuple[list[str], dict[str, t.Any]]:
     """
     Parse script arguments into positional and keyword function arguments.
@@ -36,33 +63,32 @@ def parse_function_call_args(script_args: list[str]) -> tuple[list[str], dict[st
     """
     positional_args: list[str] = []
     keyword_args: dict[str, t.Any] = {}
-    index = 0
-    while index < len(script_args):
-        argument = script_args[index]
+    append_positional = positional_args.append
+    arguments = iter(script_args)
+    argument = next(arguments, None)
+    while argument is not None:
+        following = next(arguments, None)
         if not argument.startswith("--") or argument == "--":
-            positional_args.append(argument)
-            index += 1
+            append_positional(argument)
+            argument = following
             continue
 
         option = argument[2:]
         if not option:
             raise typer.BadParameter("Invalid option '--'")
 
-        if "=" in option:
-            option_name, option_value = option.split("=", 1)
-        else:
-            option_name = option
-            next_value_index = index + 1
-            if next_value_index < len(script_args) and not script_args[next_value_index].startswith(
-                "--"
-            ):
-                option_value = script_args[next_value_index]
-                index += 1
+        option_name, separator, option_value = option.partition("=")
+        if not separator:
+            if following is not None and not following.startswith("--"):
+                option_value = following
+                following = next(arguments, None)
             else:
                 option_value = True
 
-        keyword_args[option_name.replace("-", "_")] = option_value
-        index += 1
+        if "-" in option_name:
+            option_name = option_name.replace("-", "_")
+        keyword_args[option_name] = option_value
+        argument = following
 
     return positional_args, keyword_args
 
@@ -105,10 +131,12 @@ async def run_script_with_batchify(
     live_display : bool
         Live display toggle passed to ``batchify``.
     """
-    if not module_path.exists():
+    try:
+        module_mode = module_path.stat().st_mode
+    except OSError:
         typer.echo(f"Script not found: {module_path}")
         raise typer.Exit(1)
-    if not module_path.is_file():
+    if not stat.S_ISREG(module_mode):
         typer.echo(f"Script path is not a file: {module_path}")
         raise typer.Exit(1)
 
@@ -11,6 +11,11 @@ from batchling.core import Batcher
 from batchling.exceptions import DryRunEarlyExit
 from batchling.hooks import active_batcher
 
+# Strong references to close tasks scheduled by sync ``__exit__``: the event loop
+# only keeps weak references to tasks, so an unreferenced one may be collected
+# before it finishes flushing the batcher.
+_PENDING_SYNC_CLOSES: set[asyncio.Task[None]] = set()
+
 
 class BatchingContext:
     """
@@ -24,6 +29,13 @@ class BatchingContext:
         Whether to enable auto live display behavior for the context.
     """
 
+    __slots__ = (
+        "_self_batcher",
+        "_self_live_display_enabled",
+        "_self_display_report_controller",
+        "_self_context_token",
+    )
+
     def __init__(
         self,
         *,
@@ -48,6 +60,21 @@ class BatchingContext:
         )
         self._self_context_token: t.Any | None = None
 
+    def _activate_batcher(self) -> None:
+        """
+        Make this context's batcher active unless it already is.
+
+        Notes
+        -----
+        Re-entering a scope whose batcher is already active (nested or chained
+        contexts sharing one batcher) skips the ``ContextVar`` set/reset pair, so no
+        token is allocated and exit leaves the outer activation in place.
+        """
+        if active_batcher.get() is self._self_batcher:
+            self._self_context_token = None
+            return
+        self._self_context_token = active_batcher.set(self._self_batcher)
+
     def __enter__(self) -> None:
         """
         Enter the synchronous context manager and activate the batcher.
@@ -57,7 +84,7 @@ class BatchingContext:
         None
             ``None`` for scoped activation.
         """
-        self._self_context_token = active_batcher.set(self._self_batcher)
+        self._activate_batcher()
         self._self_display_report_controller.start()
         return None
 
@@ -88,11 +115,10 @@ class BatchingContext:
         if self._self_context_token is not None:
             active_batcher.reset(self._self_context_token)
             self._self_context_token = None
-        try:
-            loop = asyncio.get_running_loop()
-            close_task = loop.create_task(coro=self._self_batcher.close())
-            close_task.add_done_callback(self._on_sync_close_done)
-        except RuntimeError:
+        # ``_get_running_loop`` returns ``None`` instead of raising, so the common
+        # no-loop path does not build and unwind a ``RuntimeError``.
+        loop = asyncio._get_running_loop()
+        if loop is None:
             warnings.warn(
                 message=(
                     "BatchingContext used with sync context manager. "
@@ -103,6 +129,12 @@ class BatchingContext:
                 stacklevel=2,
             )
             self._self_display_report_controller.finalize()
+            return should_suppress
+
+        close_task = loop.create_task(coro=self._self_batcher.close())
+        _PENDING_SYNC_CLOSES.add(close_task)
+        close_task.add_done_callback(_PENDING_SYNC_CLOSES.discard)
+        close_task.add_done_callback(self._on_sync_close_done)
         return should_suppress
 
     def _on_sync_close_done(self, close_task: asyncio.Task[None]) -> None:
@@ -135,7 +167,7 @@ class BatchingContext:
         None
             ``None`` for scoped activation.
         """
-        self._self_context_token = active_batcher.set(self._self_batcher)
+        self._activate_batcher()
         self._self_display_report_controller.start()
         return None
 
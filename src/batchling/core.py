@@ -7,6 +7,7 @@ Should support multiple queues for multiple providers/endpoints/models called in
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -35,9 +36,10 @@ log = logging.getLogger(name=__name__)
 QueueKey = tuple[str, str, str]
 ResumedBatchKey = tuple[str, str, str]
 CACHE_RETENTION_SECONDS = 30 * 24 * 60 * 60
+MAX_CONCURRENT_POLLS = 32
 
 
-@dataclass
+@dataclass(slots=True)
 class _PendingRequest:
     # FIXME: _PendingRequest can use a generic type to match any request from:
     # - http.client.HTTPSConnection.request
@@ -66,7 +68,7 @@ class _ActiveBatch:
     max_progress_completed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class _ResumedPendingRequest:
     """A pending request attached to a resumed provider batch."""
 
@@ -155,6 +157,7 @@ class Batcher:
         self._pending_by_provider: dict[QueueKey, list[_PendingRequest]] = {}
         self._pending_lock = asyncio.Lock()
         self._window_tasks: dict[QueueKey, asyncio.Task[None]] = {}
+        self._closing: asyncio.Task[None] | None = None
 
         # Active batches being tracked
         self._active_batches: list[_ActiveBatch] = []
@@ -162,6 +165,7 @@ class Batcher:
             timeout=30.0
         )
         self._poll_interval_seconds = batch_poll_interval_seconds
+        self._poll_semaphore = asyncio.Semaphore(value=MAX_CONCURRENT_POLLS)
         self._batch_tasks: set[asyncio.Task[None]] = set()
         self._resumed_poll_tasks: set[asyncio.Task[None]] = set()
         self._resumed_batches: dict[ResumedBatchKey, _ResumedBatch] = {}
@@ -753,6 +757,7 @@ class Batcher:
         return provider.name, endpoint, model
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _resolve_host(*, url: str) -> str:
         """
         Resolve request host from raw URL-like input.
@@ -766,6 +771,11 @@ class Batcher:
         -------
         str
             Lowercased host.
+
+        Notes
+        -----
+        Results are memoized per URL since every request to a provider
+        resolves the same host.
         """
         parsed_url = urlparse(url=url)
         if parsed_url.hostname:
@@ -1555,7 +1565,10 @@ class Batcher:
                 batch_id=batch_submission.batch_id,
                 source=BatcherEventSource.POLL_START,
             )
-            self._write_cache_entries(
+            # Cache persistence is blocking SQLite I/O: run it off the event loop so
+            # other queues keep submitting and polling meanwhile.
+            await asyncio.to_thread(
+                self._write_cache_entries,
                 queue_key=queue_key,
                 requests=requests,
                 batch_id=batch_submission.batch_id,
@@ -1627,15 +1640,30 @@ class Batcher:
         -------
         PollSnapshot
             Snapshot of provider batch status and output/error file IDs.
+
+        Notes
+        -----
+        Polls for all in-flight batches share one semaphore so that many
+        concurrent batches fan out to at most ``MAX_CONCURRENT_POLLS``
+        simultaneous provider requests.
         """
         poll_request_spec = provider.build_poll_request_spec(
             base_url=base_url,
             api_headers=api_headers,
             batch_id=batch_id,
         )
-        response = await self._execute_provider_request(
-            base_url=base_url,
-            request_spec=poll_request_spec,
+        async with self._poll_semaphore:
+            started_at = time.perf_counter()
+            response = await self._execute_provider_request(
+                base_url=base_url,
+                request_spec=poll_request_spec,
+            )
+        log_debug(
+            logger=log,
+            event="Polled batch",
+            provider=provider.name,
+            batch_id=batch_id,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 1),
         )
         payload = response.json()
         return await provider.parse_poll_response(
@@ -1695,7 +1723,7 @@ class Batcher:
             active_batch.error_file_id = poll_snapshot.error_file_id
             active_batch.result_locator = poll_snapshot.result_locator
 
-            if poll_snapshot.status in provider.batch_terminal_states:
+            if provider.is_terminal_status(status=poll_snapshot.status):
                 log_info(
                     logger=log,
                     event="Batch reached terminal state",
@@ -1766,7 +1794,7 @@ class Batcher:
                     progress_percent=progress_percent,
                     source=BatcherEventSource.RESUMED_POLL,
                 )
-                if poll_snapshot.status in provider.batch_terminal_states:
+                if provider.is_terminal_status(status=poll_snapshot.status):
                     self._emit_batch_terminal_event(
                         provider=provider.name,
                         batch_id=batch_id,
@@ -2051,7 +2079,34 @@ class Batcher:
 
         Notes
         -----
-        Pending requests are submitted per provider before closing.
+        Pending requests are submitted per provider before closing. The flush runs
+        as one task: concurrent ``close()`` calls (for example nested scopes sharing
+        one batcher) join it instead of running their own, and every caller
+        observes its outcome, including exceptions and cancellation. Cancelling a
+        caller does not cancel the shared flush.
+        """
+        closing = self._closing
+        if closing is None:
+            closing = asyncio.create_task(coro=self._flush_and_drain(), name="batcher_close")
+            closing.add_done_callback(self._on_close_done)
+            self._closing = closing
+        await asyncio.shield(closing)
+
+    def _on_close_done(self, closing: asyncio.Task[None]) -> None:
+        """
+        Forget a finished flush task so the next ``close()`` starts a new one.
+
+        Parameters
+        ----------
+        closing : asyncio.Task[None]
+            Completed flush task.
+        """
+        if self._closing is closing:
+            self._closing = None
+
+    async def _flush_and_drain(self) -> None:
+        """
+        Submit pending requests and wait for in-flight background tasks.
         """
         for queue_key, window_task in list(self._window_tasks.items()):
             if window_task and not window_task.done():
@@ -2094,3 +2149,5 @@ class Batcher:
         # leaves the batcher in a stable state for summary/report consumers.
         await self._drain_task_set(tasks=self._batch_tasks)
         await self._drain_task_set(tasks=self._resumed_poll_tasks)
+        if self._cache_store is not None:
+            self._cache_store.close()
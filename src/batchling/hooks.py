@@ -7,6 +7,7 @@ The context var is set by the `batchify` function upon calling.
 """
 
 import contextvars
+import functools
 import json
 import logging
 import typing as t
@@ -171,9 +172,14 @@ def _normalize_httpx_headers(*, headers: httpx.Headers) -> dict[str, str]:
     -------
     dict[str, str]
         Normalized header mapping.
+
+    Notes
+    -----
+    ``httpx.Headers.raw`` always holds ``bytes`` pairs, so values are decoded
+    directly instead of dispatching through ``_decode_header_value``.
     """
     return {
-        _decode_header_value(value=key).lower(): _decode_header_value(value=value)
+        key.decode(encoding="latin1").lower(): value.decode(encoding="latin1")
         for key, value in headers.raw
     }
 
@@ -245,6 +251,9 @@ def _ensure_response_request(
 def _extract_aiohttp_body(*, kwargs: dict[str, t.Any]) -> bytes | None:
     """
     Convert aiohttp request kwargs into raw body bytes for queueing.
+
+    ``bytes`` bodies are immutable and returned as-is; only mutable buffers
+    are copied.
     """
     if kwargs.get("json") is not None:
         return json.dumps(obj=kwargs["json"]).encode(encoding="utf-8")
@@ -258,9 +267,35 @@ def _extract_aiohttp_body(*, kwargs: dict[str, t.Any]) -> bytes | None:
         return raw_data.encode(encoding="utf-8")
     if isinstance(raw_data, bytearray):
         return bytes(raw_data)
+    if isinstance(raw_data, memoryview):
+        return raw_data.tobytes()
     return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_request_url(*, url: str) -> tuple[str, str]:
+    """
+    Split a request URL into its routing hostname and path.
+
+    Parameters
+    ----------
+    url : str
+        Request URL.
+
+    Returns
+    -------
+    tuple[str, str]
+        Lowercased hostname and path (``"/"`` when empty).
+
+    Notes
+    -----
+    Results are memoized since clients hit the same few endpoint URLs
+    for every intercepted request.
+    """
+    parsed = urlparse(url=url)
+    return (parsed.hostname or "").lower(), parsed.path or "/"
+
+
 def _maybe_route_to_batcher(
     *,
     method: str,
@@ -289,9 +324,11 @@ def _maybe_route_to_batcher(
         Routing data if batching is active, otherwise ``None``.
     """
     batcher = active_batcher.get()
-    parsed = urlparse(url=url)
-    hostname = (parsed.hostname or "").lower()
-    path = parsed.path or "/"
+    if batcher is None and not log.isEnabledFor(logging.DEBUG):
+        # Hooks are process-wide: traffic outside any batchify scope only needs
+        # URL parsing and provider resolution to explain the skip in debug logs.
+        return None
+    hostname, path = _split_request_url(url=url)
     provider = get_provider_for_batch_request(method=method, hostname=hostname, path=path)
     if batcher is None or provider is None:
         if batcher is None and provider is None:
@@ -364,8 +401,6 @@ async def _httpx_async_send_hook(self, request: httpx.Request, **kwargs: t.Any)
     """
     url_str = str(object=request.url)
     headers, body = _extract_body_and_headers_from_request(request=request)
-    request_headers = _normalize_httpx_headers(headers=request.headers)
-    headers = {**request_headers, **headers}
     if headers.get("x-batchling-internal") == "1":
         return await _BASE_HTTPX_ASYNC_SEND(self, request, **kwargs)
 
@@ -36,6 +36,16 @@ class BatcherEventSource(StrEnum):
     CLOSE = "close"
 
 
+# Value -> member tables: listeners parse every emitted event, and a dict lookup
+# avoids ``EnumType.__call__`` and its ``ValueError`` path for unknown values.
+_EVENT_TYPES_BY_VALUE: dict[str, BatcherEventType] = {
+    member.value: member for member in BatcherEventType
+}
+_EVENT_SOURCES_BY_VALUE: dict[str, BatcherEventSource] = {
+    member.value: member for member in BatcherEventSource
+}
+
+
 class BatcherEvent(t.TypedDict, total=False):
     """
     Lifecycle event emitted by ``Batcher`` for optional observers.
@@ -107,14 +117,9 @@ def parse_event_type(*, event: BatcherEvent) -> BatcherEventType | None:
         Parsed lifecycle event type, or ``None`` when missing/unknown.
     """
     raw_event_type = event.get("event_type")
-    if isinstance(raw_event_type, BatcherEventType):
-        return raw_event_type
     if not isinstance(raw_event_type, str):
         return None
-    try:
-        return BatcherEventType(raw_event_type)
-    except ValueError:
-        return None
+    return _EVENT_TYPES_BY_VALUE.get(raw_event_type)
 
 
 def parse_event_source(*, event: BatcherEvent) -> BatcherEventSource | None:
@@ -132,14 +137,9 @@ def parse_event_source(*, event: BatcherEvent) -> BatcherEventSource | None:
         Parsed lifecycle event source, or ``None`` when missing/unknown.
     """
     raw_source = event.get("source")
-    if isinstance(raw_source, BatcherEventSource):
-        return raw_source
     if not isinstance(raw_source, str):
         return None
-    try:
-        return BatcherEventSource(raw_source)
-    except ValueError:
-        return None
+    return _EVENT_SOURCES_BY_VALUE.get(raw_source)
 
 
 BatcherEventListener = t.Callable[[BatcherEvent], None]
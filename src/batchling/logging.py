@@ -63,6 +63,8 @@ def log_debug(*, logger: logging.Logger, event: str, **context: t.Any) -> None:
     **context : typing.Any
         Optional log context.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     logger.debug(msg=_format_log_message(event=event, **context))
 
 
@@ -79,6 +81,8 @@ def log_info(*, logger: logging.Logger, event: str, **context: t.Any) -> None:
     **context : typing.Any
         Optional log context.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(msg=_format_log_message(event=event, **context))
 
 
@@ -95,6 +99,8 @@ def log_warning(*, logger: logging.Logger, event: str, **context: t.Any) -> None
     **context : typing.Any
         Optional log context.
     """
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     logger.warning(msg=_format_log_message(event=event, **context))
 
 
@@ -111,4 +117,6 @@ def log_error(*, logger: logging.Logger, event: str, **context: t.Any) -> None:
     **context : typing.Any
         Optional log context.
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     logger.error(msg=_format_log_message(event=event, **context))
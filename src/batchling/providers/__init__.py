@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import inspect
 import typing as t
@@ -95,6 +96,7 @@ PROVIDERS: list[BaseProvider] = _load_providers()
 _HOSTNAME_INDEX = _build_provider_indexes(providers=PROVIDERS)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_provider_for_batch_request(*, method: str, hostname: str, path: str) -> BaseProvider | None:
     """
     Resolve a provider only when the request is explicitly batchable.
@@ -112,6 +114,13 @@ def get_provider_for_batch_request(*, method: str, hostname: str, path: str) ->
     -------
     BaseProvider | None
         Provider instance if this request is batchable, otherwise ``None``.
+
+    Notes
+    -----
+    Providers are module-level singletons with static routing configuration, so
+    resolutions are memoized: intercepted traffic repeats the same few
+    ``(method, hostname, path)`` triples, and misses for unknown hosts would
+    otherwise rescan every provider on each request.
     """
     candidates = _HOSTNAME_INDEX.get(hostname, []) if hostname else []
 
@@ -183,15 +183,16 @@ class AnthropicProvider(BaseProvider):
         response = t.cast(dict[str, t.Any] | None, result.get("message"))
         if response:
             status_code = 200
-            headers = dict(response.get("headers") or {})
+            response_headers = response.get("headers")
             body = response
         else:
             status_code = 500
-            headers = {}
+            response_headers = None
             body = t.cast(dict[str, t.Any], result.get("error") or {"error": "Missing response"})
 
-        content, content_headers = self.encode_body(body=body)
-        headers.update(content_headers)
+        content, headers = self.encode_body(body=body)
+        if response_headers:
+            headers = {**response_headers, **headers}
 
         return httpx.Response(
             status_code=status_code,
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
 import re
+import secrets
 import typing as t
 from abc import ABC
 from dataclasses import dataclass
@@ -14,6 +16,16 @@ from batchling.logging import log_debug, log_info
 
 log = logging.getLogger(name=__name__)
 
+# Batch input lines are freshly built acyclic dicts: skip the circular-reference
+# bookkeeping and whitespace that ``json.dumps`` defaults to on every line.
+JSONL_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+_API_HEADER_NAMES = {
+    "authorization": "Authorization",
+    "x-api-key": "X-Api-Key",
+    "x-goog-api-key": "x-goog-api-key",
+}
+
 
 @dataclass(frozen=True)
 class BatchSubmission:
@@ -140,6 +152,119 @@ class BatchPayload(t.TypedDict):
     metadata: t.NotRequired[dict[str, str]]
 
 
+def _encode_multipart_form(
+    *,
+    data: dict[str, str],
+    files: dict[str, tuple[str, bytes, str]],
+) -> tuple[bytes, str]:
+    """
+    Encode form fields and in-memory files as one ``multipart/form-data`` body.
+
+    Parameters
+    ----------
+    data : dict[str, str]
+        Plain form fields.
+    files : dict[str, tuple[str, bytes, str]]
+        File fields as ``(filename, content, content_type)`` tuples.
+
+    Returns
+    -------
+    tuple[bytes, str]
+        Encoded body and the matching ``Content-Type`` header value.
+
+    Notes
+    -----
+    Batch uploads are a single in-memory file plus a few constant fields, so the
+    envelope is assembled with one ``bytes.join`` instead of going through
+    httpx's per-part multipart stream. A random boundary is drawn per upload so
+    it cannot collide with JSONL content.
+    """
+    boundary = f"batchling-{secrets.token_hex(nbytes=16)}".encode(encoding="ascii")
+    delimiter = b"--" + boundary + b"\r\n"
+    parts: list[bytes] = []
+    for name, value in data.items():
+        parts += (
+            delimiter,
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode(encoding="utf-8"),
+            value.encode(encoding="utf-8"),
+            b"\r\n",
+        )
+    for name, (filename, content, content_type) in files.items():
+        parts += (
+            delimiter,
+            (
+                f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n"
+            ).encode(encoding="utf-8"),
+            content,
+            b"\r\n",
+        )
+    parts.append(b"--" + boundary + b"--\r\n")
+    return b"".join(parts), f"multipart/form-data; boundary={boundary.decode(encoding='ascii')}"
+
+
+def _iter_jsonl_items(*, content: str) -> t.Iterator[t.Any]:
+    """
+    Lazily decode non-blank JSONL rows.
+
+    Parameters
+    ----------
+    content : str
+        Raw JSONL content.
+
+    Yields
+    ------
+    typing.Any
+        Decoded JSON value for each non-blank line.
+
+    Notes
+    -----
+    Lines are located with ``str.find`` on the unconsumed tail rather than
+    ``splitlines()``, which would materialize every line up front and also split
+    on Unicode line separators that may legally appear inside JSON strings.
+    """
+    loads = json.loads
+    find = content.find
+    start = 0
+    content_length = len(content)
+    while start < content_length:
+        end = find("\n", start)
+        if end == -1:
+            end = content_length
+        line = content[start:end]
+        start = end + 1
+        if line.strip():
+            yield loads(line)
+
+
+@contextlib.asynccontextmanager
+async def _open_client(
+    *,
+    client: httpx.AsyncClient | None,
+    client_factory: t.Callable[[], httpx.AsyncClient],
+) -> t.AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield an already-open client, or open a new one from ``client_factory``.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient | None
+        Open client shared across several provider calls. It is not closed here.
+    client_factory : typing.Callable[[], httpx.AsyncClient]
+        Async client factory used when ``client`` is ``None``.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        Client to send the request with.
+    """
+    if client is not None:
+        yield client
+        return
+    async with client_factory() as owned_client:
+        yield owned_client
+
+
 class BatchTerminalStatesLike(t.Protocol):
     SUCCESS: str
     FAILED: str
@@ -170,6 +295,42 @@ class BaseProvider(ABC):
     output_file_field_name: str
     error_file_field_name: str
     supported_completion_windows: tuple[str, ...] = ("24h",)
+    _terminal_state_values: frozenset[str] = frozenset()
+    _static_batchable_endpoints: frozenset[str] = frozenset()
+    _templated_batchable_endpoint_pattern: re.Pattern[str] | None = None
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """
+        Precompute membership sets and endpoint matchers from class attributes.
+
+        Parameters
+        ----------
+        **kwargs : typing.Any
+            Keyword arguments forwarded to ``object.__init_subclass__``.
+        """
+        super().__init_subclass__(**kwargs)
+        terminal_states = getattr(cls, "batch_terminal_states", None)
+        if terminal_states is not None:
+            cls._terminal_state_values = frozenset(str(object=state) for state in terminal_states)
+        cls._static_batchable_endpoints = frozenset(
+            endpoint for endpoint in cls.batchable_endpoints if "{" not in endpoint
+        )
+        templated_endpoint_patterns = [
+            re.sub(
+                pattern=r"\\\{[^{}]+\\\}",
+                repl=r"[^/]+",
+                string=re.escape(pattern=endpoint),
+            )
+            for endpoint in cls.batchable_endpoints
+            if "{" in endpoint
+        ]
+        cls._templated_batchable_endpoint_pattern = (
+            re.compile(
+                pattern="|".join(f"(?:{pattern})" for pattern in templated_endpoint_patterns)
+            )
+            if templated_endpoint_patterns
+            else None
+        )
 
     def validate_completion_window(self, *, completion_window: str) -> None:
         """
@@ -276,22 +437,11 @@ class BaseProvider(ABC):
             Endpoints may include template placeholders such as ``{model}``,
             which match one path segment (excluding ``/``).
         """
-        for endpoint in self.batchable_endpoints:
-            if "{" not in endpoint:
-                if path == endpoint:
-                    return True
-                continue
+        if path in self._static_batchable_endpoints:
+            return True
 
-            escaped_endpoint = re.escape(pattern=endpoint)
-            endpoint_pattern = re.sub(
-                pattern=r"\\\{[^{}]+\\\}",
-                repl=r"[^/]+",
-                string=escaped_endpoint,
-            )
-            if re.fullmatch(pattern=endpoint_pattern, string=path) is not None:
-                return True
-
-        return False
+        endpoint_pattern = self._templated_batchable_endpoint_pattern
+        return endpoint_pattern is not None and endpoint_pattern.fullmatch(path) is not None
 
     def extract_model_name(self, *, endpoint: str, body: bytes | None) -> str:
         """
@@ -449,6 +599,22 @@ class BaseProvider(ABC):
             headers=api_headers,
         )
 
+    def is_terminal_status(self, *, status: str) -> bool:
+        """
+        Check whether a polled batch status stops polling.
+
+        Parameters
+        ----------
+        status : str
+            Normalized provider batch status.
+
+        Returns
+        -------
+        bool
+            ``True`` when ``status`` is one of ``batch_terminal_states``.
+        """
+        return status in self._terminal_state_values
+
     def extract_batch_status(self, *, payload: dict[str, t.Any]) -> str:
         """
         Extract provider batch status from a poll payload.
@@ -580,27 +746,35 @@ class BaseProvider(ABC):
             percent = 0.0
         return completed, percent
 
-    def build_internal_headers(self, *, headers: dict[str, str]) -> dict[str, str]:
+    def build_internal_api_headers(self, *, headers: dict[str, str]) -> dict[str, str]:
         """
-        Add internal bypass headers to provider API requests.
+        Extract provider API headers and add the internal bypass marker.
 
         Parameters
         ----------
         headers : dict[str, str]
-            Provider API headers.
+            Original request headers.
 
         Returns
         -------
         dict[str, str]
-            Headers including internal bypass marker.
+            Provider API headers including internal bypass marker.
+
+        Notes
+        -----
+        This is the single place the ``x-batchling-internal`` marker is added, so
+        hooks let provider API calls through unbatched. ``build_api_headers`` always
+        returns a fresh dict, so the marker is set in place.
         """
-        return {**headers, "x-batchling-internal": "1"}
+        api_headers = self.build_api_headers(headers=headers)
+        api_headers["x-batchling-internal"] = "1"
+        return api_headers
 
     def build_jsonl_lines(
         self,
         *,
         requests: t.Sequence[PendingRequestLike],
-    ) -> list[dict[str, t.Any]]:
+    ) -> t.Iterable[dict[str, t.Any]]:
         """
         Build provider batch-file JSONL lines.
 
@@ -611,10 +785,11 @@ class BaseProvider(ABC):
 
         Returns
         -------
-        list[dict[str, typing.Any]]
-            JSONL-ready request lines.
+        typing.Iterable[dict[str, typing.Any]]
+            JSONL-ready request lines, built lazily so the file upload can
+            serialize each line without holding every parsed body at once.
         """
-        return [
+        return (
             {
                 "custom_id": request.custom_id,
                 "method": request.params["method"],
@@ -624,7 +799,7 @@ class BaseProvider(ABC):
                 ),
             }
             for request in requests
-        ]
+        )
 
     def encode_body(self, *, body: dict[str, t.Any]) -> tuple[bytes, dict[str, str]]:
         """
@@ -657,16 +832,14 @@ class BaseProvider(ABC):
         dict[str, str]
             Request headers with bearer token extracted.
         """
+        provider_prefix = f"{self.name}-"
         api_headers: dict[str, str] = {}
         for key, value in headers.items():
             lower_key = key.lower()
-            if lower_key == "authorization":
-                api_headers["Authorization"] = value
-            elif lower_key == "x-api-key":
-                api_headers["X-Api-Key"] = value
-            elif lower_key == "x-goog-api-key":
-                api_headers["x-goog-api-key"] = value
-            elif lower_key.startswith(f"{self.name}-"):
+            api_key = _API_HEADER_NAMES.get(lower_key)
+            if api_key is not None:
+                api_headers[api_key] = value
+            elif lower_key.startswith(provider_prefix):
                 api_headers[key] = value
         return api_headers
 
@@ -691,9 +864,7 @@ class BaseProvider(ABC):
         ResumeContext
             Resumed polling context.
         """
-        api_headers = self.build_internal_headers(
-            headers=self.build_api_headers(headers=headers or {}),
-        )
+        api_headers = self.build_internal_api_headers(headers=headers or {})
         return ResumeContext(
             base_url=self._normalize_base_url(url=host),
             api_headers=api_headers,
@@ -722,8 +893,9 @@ class BaseProvider(ABC):
         *,
         base_url: str,
         api_headers: dict[str, str],
-        jsonl_lines: list[dict[str, t.Any]],
+        jsonl_lines: t.Iterable[dict[str, t.Any]],
         client_factory: t.Callable[[], httpx.AsyncClient],
+        client: httpx.AsyncClient | None = None,
     ) -> str:
         """
         Upload OpenAI batch input file.
@@ -734,19 +906,22 @@ class BaseProvider(ABC):
             OpenAI base URL.
         api_headers : dict[str, str]
             OpenAI API headers.
-        jsonl_lines : list[dict[str, typing.Any]]
-            JSONL line payloads.
+        jsonl_lines : typing.Iterable[dict[str, typing.Any]]
+            JSONL line payloads, consumed once.
         client_factory : typing.Callable[[], httpx.AsyncClient]
             Async client factory for provider API calls.
+        client : httpx.AsyncClient | None, optional
+            Already-open client to reuse instead of opening one from
+            ``client_factory``.
 
         Returns
         -------
         str
             OpenAI file ID.
         """
-        file_content = "\n".join(json.dumps(obj=line) for line in jsonl_lines).encode(
-            encoding="utf-8"
-        )
+        encode_line = JSONL_ENCODER.encode
+        encoded_lines = [encode_line(line) for line in jsonl_lines]
+        file_content = "\n".join(encoded_lines).encode(encoding="utf-8")
         files = self._build_batch_file_files_payload(file_content=file_content)
         data = self._build_batch_file_data_payload()
 
@@ -754,15 +929,16 @@ class BaseProvider(ABC):
             logger=log,
             event="Uploading batch file",
             provider=self.name,
-            request_count=len(jsonl_lines),
+            request_count=len(encoded_lines),
         )
 
-        async with client_factory() as client:
-            response = await client.post(
+        body, content_type = _encode_multipart_form(data=data, files=files)
+
+        async with _open_client(client=client, client_factory=client_factory) as upload_client:
+            response = await upload_client.post(
                 url=f"{base_url}{self.file_upload_endpoint}",
-                headers=api_headers,
-                files=files,
-                data=data,
+                headers={**api_headers, "Content-Type": content_type},
+                content=body,
             )
             response.raise_for_status()
             json_response = response.json()
@@ -860,6 +1036,7 @@ class BaseProvider(ABC):
         queue_key: tuple[str, str, str],
         completion_window: str,
         client_factory: t.Callable[[], httpx.AsyncClient],
+        client: httpx.AsyncClient | None = None,
     ) -> str:
         """
         Create an OpenAI batch job.
@@ -880,6 +1057,9 @@ class BaseProvider(ABC):
             Requested provider batch completion window.
         client_factory : typing.Callable[[], httpx.AsyncClient]
             Async client factory for provider API calls.
+        client : httpx.AsyncClient | None, optional
+            Already-open client to reuse instead of opening one from
+            ``client_factory``.
 
         Returns
         -------
@@ -899,8 +1079,8 @@ class BaseProvider(ABC):
             provider=self.name,
             request_path=submit_path,
         )
-        async with client_factory() as client:
-            response = await client.post(
+        async with _open_client(client=client, client_factory=client_factory) as batch_client:
+            response = await batch_client.post(
                 url=f"{base_url}{submit_path}", headers=api_headers, json=payload
             )
             response.raise_for_status()
@@ -999,46 +1179,51 @@ class BaseProvider(ABC):
             endpoint=endpoint,
             request_count=len(requests),
         )
-        api_headers = self.build_api_headers(
+        api_headers = self.build_internal_api_headers(
             headers=requests[0].params.get("headers") or dict(),
         )
-        api_headers = self.build_internal_headers(headers=api_headers)
 
         jsonl_lines = self.build_jsonl_lines(requests=requests)
-        log_debug(
-            logger=log,
-            event="Built JSONL lines",
-            provider=self.name,
-            request_count=len(jsonl_lines),
-        )
         if self.is_file_based:
-            file_id = await self._upload_batch_file(
-                base_url=base_url,
-                api_headers=api_headers,
-                jsonl_lines=jsonl_lines,
-                client_factory=client_factory,
-            )
-            log_info(
+            # Upload and batch creation hit the same host back to back: run both
+            # on one client so the second call reuses the warm connection.
+            async with client_factory() as client:
+                file_id = await self._upload_batch_file(
+                    base_url=base_url,
+                    api_headers=api_headers,
+                    jsonl_lines=jsonl_lines,
+                    client_factory=client_factory,
+                    client=client,
+                )
+                log_info(
+                    logger=log,
+                    event="Uploaded batch file",
+                    provider=self.name,
+                    file_id=file_id,
+                    request_count=len(requests),
+                )
+                batch_id = await self._create_file_based_batch_job(
+                    base_url=base_url,
+                    api_headers=api_headers,
+                    file_id=file_id,
+                    endpoint=endpoint,
+                    queue_key=queue_key,
+                    completion_window=completion_window,
+                    client_factory=client_factory,
+                    client=client,
+                )
+        else:
+            inline_lines = list(jsonl_lines)
+            log_debug(
                 logger=log,
-                event="Uploaded batch file",
+                event="Built JSONL lines",
                 provider=self.name,
-                file_id=file_id,
-                request_count=len(jsonl_lines),
+                request_count=len(inline_lines),
             )
-            batch_id = await self._create_file_based_batch_job(
-                base_url=base_url,
-                api_headers=api_headers,
-                file_id=file_id,
-                endpoint=endpoint,
-                queue_key=queue_key,
-                completion_window=completion_window,
-                client_factory=client_factory,
-            )
-        else:
             batch_id = await self._create_inline_batch_job(
                 base_url=base_url,
                 api_headers=api_headers,
-                jsonl_lines=jsonl_lines,
+                jsonl_lines=inline_lines,
                 queue_key=queue_key,
                 completion_window=completion_window,
                 client_factory=client_factory,
@@ -1121,21 +1306,22 @@ class BaseProvider(ABC):
             HTTP response derived from the batch result.
         """
         response = result_item.get("response")
-        error = result_item.get("error") or {}
+        response_headers: dict[str, str] | None = None
         if response:
-            status_code = int(response.get("status_code", 200))
-            headers = dict(response.get("headers") or {})
+            status_code = response.get("status_code", 200)
+            response_headers = response.get("headers")
             body = response.get("body")
         else:
-            status_code = int(error.get("status_code", 500))
-            headers = {}
+            error = result_item.get("error") or {}
+            status_code = error.get("status_code", 500)
             body = error or {"error": "Missing response"}
 
-        content, content_headers = self.encode_body(body=body)
-        headers.update(content_headers)
+        content, headers = self.encode_body(body=body)
+        if response_headers:
+            headers = {**response_headers, **headers}
 
         return httpx.Response(
-            status_code=status_code,
+            status_code=status_code if isinstance(status_code, int) else int(status_code),
             headers=headers,
             content=content,
         )
@@ -1162,11 +1348,11 @@ class BaseProvider(ABC):
             Responses keyed by provider custom ID.
         """
         decoded: dict[str, httpx.Response] = {}
-        for line in content.splitlines():
-            if not line.strip():
-                continue
-            result_item = json.loads(s=line)
-            custom_id = result_item.get(self.custom_id_field_name)
+        # Bind per-line lookups once: result files can hold many thousands of rows.
+        custom_id_field_name = self.custom_id_field_name
+        from_batch_result = self.from_batch_result
+        for result_item in _iter_jsonl_items(content=content):
+            custom_id = result_item.get(custom_id_field_name)
             if custom_id is None:
                 log_debug(
                     logger=log,
@@ -1175,5 +1361,5 @@ class BaseProvider(ABC):
                     batch_id=batch_id,
                 )
                 continue
-            decoded[str(object=custom_id)] = self.from_batch_result(result_item=result_item)
+            decoded[str(object=custom_id)] = from_batch_result(result_item=result_item)
         return decoded
@@ -8,12 +8,14 @@ import httpx
 
 from batchling.logging import log_debug
 from batchling.providers.base import (
+    JSONL_ENCODER,
     BaseProvider,
     BatchTerminalStatesLike,
     PendingRequestLike,
     PollSnapshot,
     ProviderRequestSpec,
     ResumeContext,
+    _open_client,
 )
 
 log = logging.getLogger(name=__name__)
@@ -288,6 +290,7 @@ class GeminiProvider(BaseProvider):
         base_url: str,
         api_headers: dict[str, str],
         client_factory: t.Callable[[], httpx.AsyncClient],
+        client: httpx.AsyncClient | None = None,
     ) -> str:
         """
         Create a resumable upload session for the provider.
@@ -300,6 +303,9 @@ class GeminiProvider(BaseProvider):
             API headers.
         client_factory : typing.Callable[[], httpx.AsyncClient]
             Async client factory for provider API calls.
+        client : httpx.AsyncClient | None, optional
+            Already-open client to reuse instead of opening one from
+            ``client_factory``.
 
         Returns
         -------
@@ -317,8 +323,8 @@ class GeminiProvider(BaseProvider):
                 "display_name": "batch.jsonl",
             }
         }
-        async with client_factory() as client:
-            response = await client.post(
+        async with _open_client(client=client, client_factory=client_factory) as session_client:
+            response = await session_client.post(
                 url=f"{base_url}{self.file_upload_endpoint}",
                 headers={**api_headers, **additional_headers},
                 json=data,
@@ -332,8 +338,9 @@ class GeminiProvider(BaseProvider):
         *,
         base_url: str,
         api_headers: dict[str, str],
-        jsonl_lines: list[dict[str, t.Any]],
+        jsonl_lines: t.Iterable[dict[str, t.Any]],
         client_factory: t.Callable[[], httpx.AsyncClient],
+        client: httpx.AsyncClient | None = None,
     ) -> str:
         """
         Upload OpenAI batch input file.
@@ -344,10 +351,13 @@ class GeminiProvider(BaseProvider):
             OpenAI base URL.
         api_headers : dict[str, str]
             OpenAI API headers.
-        jsonl_lines : list[dict[str, typing.Any]]
-            JSONL line payloads.
+        jsonl_lines : typing.Iterable[dict[str, typing.Any]]
+            JSONL line payloads, consumed once.
         client_factory : typing.Callable[[], httpx.AsyncClient]
             Async client factory for provider API calls.
+        client : httpx.AsyncClient | None, optional
+            Already-open client to reuse instead of opening one from
+            ``client_factory``.
 
         Returns
         -------
@@ -363,23 +373,24 @@ class GeminiProvider(BaseProvider):
             base_url=base_url,
             api_headers=api_headers,
             client_factory=client_factory,
+            client=client,
         )
         additional_headers = {
             "X-Goog-Upload-Offset": "0",
             "X-Goog-Upload-Command": "upload, finalize",
         }
 
-        file_content = ("\n".join(json.dumps(obj=line) for line in jsonl_lines) + "\n").encode(
-            encoding="utf-8"
-        )
+        encode_line = JSONL_ENCODER.encode
+        encoded_lines = [encode_line(line) for line in jsonl_lines]
+        file_content = ("\n".join(encoded_lines) + "\n").encode(encoding="utf-8")
         log_debug(
             logger=log,
             event="Uploading batch file",
             provider=self.name,
-            request_count=len(jsonl_lines),
+            request_count=len(encoded_lines),
         )
-        async with client_factory() as client:
-            response = await client.post(
+        async with _open_client(client=client, client_factory=client_factory) as upload_client:
+            response = await upload_client.post(
                 url=upload_url,
                 headers={**api_headers, **additional_headers},
                 content=file_content,
@@ -432,15 +443,16 @@ class GeminiProvider(BaseProvider):
         error = result_item.get("error") or {}
         if response:
             status_code = int(response.get("status_code", 200))
-            headers = dict(response.get("headers") or {})
+            response_headers = response.get("headers")
             body = response
         else:
             status_code = int(error.get("status_code", 500))
-            headers = {}
+            response_headers = None
             body = error or {"error": "Missing response"}
 
-        content, content_headers = self.encode_body(body=body)
-        headers.update(content_headers)
+        content, headers = self.encode_body(body=body)
+        if response_headers:
+            headers = {**response_headers, **headers}
 
         return httpx.Response(
             status_code=status_code,
@@ -118,7 +118,7 @@ class GroqProvider(OpenAIProvider):
         self,
         *,
         requests: t.Sequence[PendingRequestLike],
-    ) -> list[dict[str, t.Any]]:
+    ) -> t.Iterator[dict[str, t.Any]]:
         """
         Build JSONL lines with canonical endpoint URLs for Groq batches.
 
@@ -127,15 +127,14 @@ class GroqProvider(OpenAIProvider):
         requests : typing.Sequence[PendingRequestLike]
             Pending requests to serialize.
 
-        Returns
-        -------
-        list[dict[str, typing.Any]]
+        Yields
+        ------
+        dict[str, typing.Any]
             JSONL lines with ``url`` normalized to ``/v1/...``.
         """
-        jsonl_lines = super().build_jsonl_lines(requests=requests)
-        for line in jsonl_lines:
+        for line in super().build_jsonl_lines(requests=requests):
             line["url"] = self._strip_openai_prefix(path=line["url"])
-        return jsonl_lines
+            yield line
 
     async def build_file_based_batch_payload(
         self,
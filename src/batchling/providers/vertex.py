@@ -10,6 +10,7 @@ from urllib.parse import quote
 import httpx
 
 from batchling.providers.base import (
+    JSONL_ENCODER,
     BaseProvider,
     BatchSubmission,
     BatchTerminalStatesLike,
@@ -357,8 +358,8 @@ class VertexProvider(BaseProvider):
 
         gcs_prefix = self._parse_gcs_prefix(uri=vertex_gcs_prefix)
         base_url = self._normalize_base_url(url=requests[0].params["url"])
-        api_headers = self.build_internal_headers(
-            headers=self.build_api_headers(headers=requests[0].params.get("headers") or {}),
+        api_headers = self.build_internal_api_headers(
+            headers=requests[0].params.get("headers") or {},
         )
 
         batch_token = requests[0].custom_id.split(sep="-")[0]
@@ -597,7 +598,7 @@ class VertexProvider(BaseProvider):
         str
             Uploaded GCS URI.
         """
-        payload = ("\n".join(json.dumps(obj=line) for line in jsonl_lines) + "\n").encode(
+        payload = ("\n".join(JSONL_ENCODER.encode(line) for line in jsonl_lines) + "\n").encode(
             encoding="utf-8"
         )
         upload_url = (
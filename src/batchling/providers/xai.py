@@ -205,17 +205,18 @@ class XaiProvider(BaseProvider):
         response = t.cast(dict[str, t.Any] | None, result_item.get("response"))
         if response:
             status_code = 200
-            headers = dict(response.get("headers") or {})
+            response_headers = response.get("headers")
             body = response
         else:
             status_code = 500
-            headers = {}
+            response_headers = None
             body = t.cast(
                 dict[str, t.Any], result_item.get("error") or {"error": "Missing response"}
             )
 
-        content, content_headers = self.encode_body(body=body)
-        headers.update(content_headers)
+        content, headers = self.encode_body(body=body)
+        if response_headers:
+            headers = {**response_headers, **headers}
 
         return httpx.Response(
             status_code=status_code,
@@ -353,10 +354,9 @@ class XaiProvider(BaseProvider):
             endpoint=endpoint,
             request_count=len(requests),
         )
-        api_headers = self.build_api_headers(
+        api_headers = self.build_internal_api_headers(
             headers=requests[0].params.get("headers") or dict(),
         )
-        api_headers = self.build_internal_headers(headers=api_headers)
 
         jsonl_lines = self.build_jsonl_lines(requests=requests)
         log_debug(
@@ -117,8 +117,9 @@ def _build_queue_table(
         table.add_row(*empty_row)
         return table
 
+    add_row = table.add_row
     for row in rows:
-        table.add_row(*row)
+        add_row(*row)
     return table
 
 
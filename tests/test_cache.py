@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
+from dataclasses import replace
 from pathlib import Path
 
 from batchling.cache import CacheEntry, RequestCacheStore
@@ -153,3 +155,193 @@ def test_upsert_and_get_by_hash_roundtrip_request_count(tmp_path: Path) -> None:
     entry = store.get_by_hash(request_hash="hash-1")
     assert entry is not None
     assert entry.request_count == 4
+
+
+def test_store_reuses_one_connection_and_reopens_after_close(tmp_path: Path) -> None:
+    """
+    Ensure the store keeps a persistent WAL connection and reconnects after close.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary test directory.
+    """
+    store = RequestCacheStore(path=tmp_path / "persistent-cache.sqlite3")
+    connection = store._connect()
+
+    assert store._connect() is connection
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    store.close()
+    assert store.get_by_hash(request_hash="missing") is None
+    assert store._connect() is not connection
+
+
+def test_upsert_and_delete_span_multiple_statement_chunks(tmp_path: Path) -> None:
+    """
+    Ensure bulk writes and deletes larger than one parameter chunk are applied fully.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary test directory.
+    """
+    store = RequestCacheStore(path=tmp_path / "bulk-cache.sqlite3")
+    hashes = [f"hash-{index}" for index in range(1_200)]
+    entries = [
+        CacheEntry(
+            request_hash=request_hash,
+            provider="openai",
+            endpoint="/v1/chat/completions",
+            model="model-a",
+            host="api.openai.com",
+            batch_id="batch-1",
+            custom_id=f"custom-{index}",
+            request_count=len(hashes),
+            created_at=1.0,
+        )
+        for index, request_hash in enumerate(hashes)
+    ]
+
+    assert store.upsert_many(entries=entries) == len(hashes)
+    assert store.upsert_many(entries=entries[:5]) == 5
+    assert store.delete_by_hashes(request_hashes=[*hashes, hashes[0]]) == len(hashes)
+    assert store.get_by_hash(request_hash=hashes[-1]) is None
+
+
+def test_get_by_hash_serves_repeat_lookups_from_memory_until_invalidated(
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure found rows are memoized and store writes invalidate them.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary test directory.
+    """
+    store = RequestCacheStore(path=tmp_path / "memory-cache.sqlite3")
+    entry = CacheEntry(
+        request_hash="hash-1",
+        provider="openai",
+        endpoint="/v1/chat/completions",
+        model="model-a",
+        host="api.openai.com",
+        batch_id="batch-1",
+        custom_id="custom-1",
+        request_count=1,
+        created_at=1.0,
+    )
+    _ = store.upsert_many(entries=[entry])
+
+    first = store.get_by_hash(request_hash="hash-1")
+    assert first is not None
+    assert store.get_by_hash(request_hash="hash-1") is first
+
+    _ = store.upsert_many(entries=[replace(entry, batch_id="batch-2")])
+    updated = store.get_by_hash(request_hash="hash-1")
+    assert updated is not None
+    assert updated.batch_id == "batch-2"
+
+    assert store.delete_older_than(min_created_at=2.0) == 1
+    assert store.get_by_hash(request_hash="hash-1") is None
+
+
+def test_get_by_hash_memory_hit_does_not_wait_for_store_lock(tmp_path: Path) -> None:
+    """
+    Ensure memoized lookups are served while a write holds the store lock.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary test directory.
+    """
+    store = RequestCacheStore(path=tmp_path / "lock-free-hit.sqlite3")
+    entry = CacheEntry(
+        request_hash="hash-1",
+        provider="openai",
+        endpoint="/v1/chat/completions",
+        model="model-a",
+        host="api.openai.com",
+        batch_id="batch-1",
+        custom_id="custom-1",
+        request_count=1,
+        created_at=1.0,
+    )
+    _ = store.upsert_many(entries=[entry])
+    assert store.get_by_hash(request_hash="hash-1") == entry
+
+    results: list[CacheEntry | None] = []
+    with store._lock:
+        lookup = threading.Thread(
+            target=lambda: results.append(store.get_by_hash(request_hash="hash-1")),
+            daemon=True,
+        )
+        lookup.start()
+        lookup.join(timeout=1.0)
+
+    assert results == [entry]
+
+
+def test_concurrent_writes_and_lookups_stay_consistent(tmp_path: Path) -> None:
+    """
+    Ensure worker-thread writes and concurrent lookups do not corrupt the store.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary test directory.
+    """
+    store = RequestCacheStore(path=tmp_path / "concurrent.sqlite3")
+    hashes = [f"hash-{index}" for index in range(50)]
+    base_entry = CacheEntry(
+        request_hash="hash-0",
+        provider="openai",
+        endpoint="/v1/chat/completions",
+        model="model-a",
+        host="api.openai.com",
+        batch_id="batch-0",
+        custom_id="custom-0",
+        request_count=len(hashes),
+        created_at=time.time(),
+    )
+    errors: list[BaseException] = []
+    rounds = 30
+
+    def write() -> None:
+        try:
+            for round_index in range(rounds):
+                _ = store.upsert_many(
+                    entries=[
+                        replace(
+                            base_entry,
+                            request_hash=request_hash,
+                            batch_id=f"batch-{round_index}",
+                        )
+                        for request_hash in hashes
+                    ]
+                )
+                _ = store.delete_older_than(min_created_at=0.0)
+        except BaseException as error:
+            errors.append(error)
+
+    def read() -> None:
+        try:
+            for _ in range(rounds):
+                for request_hash in hashes:
+                    entry = store.get_by_hash(request_hash=request_hash)
+                    assert entry is None or entry.request_hash == request_hash
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=write), *(threading.Thread(target=read) for _ in range(3))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for request_hash in hashes:
+        entry = store.get_by_hash(request_hash=request_hash)
+        assert entry is not None
+        assert entry.batch_id == f"batch-{rounds - 1}"
@@ -242,6 +242,13 @@ def test_run_script_invalid_script_path():
     assert "Script not found" in result.output
 
 
+def test_run_script_path_is_not_a_file(tmp_path: Path):
+    result = runner.invoke(app, [f"{tmp_path.as_posix()}:foo"])
+
+    assert result.exit_code == 1
+    assert "Script path is not a file" in result.output
+
+
 def test_cli_catches_dry_run_early_exit(tmp_path: Path, monkeypatch) -> None:
     script_path = tmp_path / "script.py"
     script_path.write_text("async def foo():\n    return None\n")
@@ -10,7 +10,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from batchling.context import BatchingContext
+from batchling.context import _PENDING_SYNC_CLOSES, BatchingContext
 from batchling.core import Batcher, _DryRunAbortSignal
 from batchling.exceptions import DryRunEarlyExit
 from batchling.hooks import active_batcher
@@ -374,3 +374,41 @@ def test_batching_context_sync_suppresses_dry_run_early_exit(
             did_raise = True
 
     assert did_raise is False
+
+
+@pytest.mark.asyncio
+async def test_batching_context_sync_exit_keeps_close_task_referenced(
+    batcher: Batcher,
+    reset_context: None,
+) -> None:
+    """Test that sync exit holds the scheduled close task until it completes."""
+    context = BatchingContext(batcher=batcher, live_display=False)
+
+    with patch.object(target=batcher, attribute="close", new_callable=AsyncMock) as mock_close:
+        with context:
+            pass
+        assert len(_PENDING_SYNC_CLOSES) == 1
+
+        await asyncio.gather(*_PENDING_SYNC_CLOSES)
+        await asyncio.sleep(delay=0)
+
+    mock_close.assert_awaited_once()
+    assert not _PENDING_SYNC_CLOSES
+
+
+@pytest.mark.asyncio
+async def test_batching_context_reentry_with_active_batcher_skips_token(
+    batcher: Batcher,
+    reset_context: None,
+) -> None:
+    """Test that nesting a context over an already-active batcher keeps the outer scope."""
+    outer = BatchingContext(batcher=batcher, live_display=False)
+    inner = BatchingContext(batcher=batcher, live_display=False)
+
+    with patch.object(target=batcher, attribute="close", new_callable=AsyncMock):
+        async with outer:
+            async with inner:
+                assert inner._self_context_token is None
+                assert active_batcher.get() is batcher
+            assert active_batcher.get() is batcher
+        assert active_batcher.get() is None
@@ -892,6 +892,80 @@ async def test_close_idempotent(batcher: Batcher, provider: OpenAIProvider):
     assert True
 
 
+@pytest.mark.asyncio
+async def test_concurrent_close_calls_share_one_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that overlapping close() calls join the flush already in flight."""
+    batcher = Batcher(batch_size=2, batch_window_seconds=10.0, cache=False)
+    release_flush = asyncio.Event()
+    flush_calls = 0
+
+    async def slow_flush() -> None:
+        nonlocal flush_calls
+        flush_calls += 1
+        await release_flush.wait()
+
+    monkeypatch.setattr(target=batcher, name="_flush_and_drain", value=slow_flush)
+
+    close_tasks = [asyncio.create_task(coro=batcher.close()) for _ in range(3)]
+    await asyncio.sleep(delay=0)
+    release_flush.set()
+    await asyncio.gather(*close_tasks)
+    assert flush_calls == 1
+
+    await batcher.close()
+    assert flush_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_close_calls_share_flush_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a close() joining an in-flight flush sees the flush error."""
+    batcher = Batcher(batch_size=2, batch_window_seconds=10.0, cache=False)
+    release_flush = asyncio.Event()
+
+    async def failing_flush() -> None:
+        await release_flush.wait()
+        raise RuntimeError("flush failed")
+
+    monkeypatch.setattr(target=batcher, name="_flush_and_drain", value=failing_flush)
+
+    close_tasks = [asyncio.create_task(coro=batcher.close()) for _ in range(2)]
+    await asyncio.sleep(delay=0)
+    release_flush.set()
+    results = await asyncio.gather(*close_tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_close_does_not_cancel_joined_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cancelling the first close() leaves the shared flush running."""
+    batcher = Batcher(batch_size=2, batch_window_seconds=10.0, cache=False)
+    release_flush = asyncio.Event()
+    flush_completed = False
+
+    async def slow_flush() -> None:
+        nonlocal flush_completed
+        await release_flush.wait()
+        flush_completed = True
+
+    monkeypatch.setattr(target=batcher, name="_flush_and_drain", value=slow_flush)
+
+    first_close = asyncio.create_task(coro=batcher.close())
+    second_close = asyncio.create_task(coro=batcher.close())
+    await asyncio.sleep(delay=0)
+    first_close.cancel()
+    release_flush.set()
+
+    await second_close
+    assert flush_completed is True
+    with pytest.raises(asyncio.CancelledError):
+        await first_close
+
+
 @pytest.mark.asyncio
 async def test_submit_after_close(batcher: Batcher, provider: OpenAIProvider):
     """Test behavior when submitting after close."""
@@ -208,3 +208,12 @@ async def test_hook_handles_different_http_methods(restore_hooks):
 
             assert response.status_code == 200
             assert response.json()["method"] == method
+
+
+def test_extract_aiohttp_body_avoids_copying_immutable_bytes():
+    """Test that aiohttp bytes bodies are reused and buffers are converted."""
+    body = b'{"model": "gpt-4o-mini"}'
+
+    assert hooks_module._extract_aiohttp_body(kwargs={"data": body}) is body
+    assert hooks_module._extract_aiohttp_body(kwargs={"data": bytearray(body)}) == body
+    assert hooks_module._extract_aiohttp_body(kwargs={"data": memoryview(body)}) == body
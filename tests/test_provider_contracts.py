@@ -1,6 +1,7 @@
 """Tests for provider-side polling/results/resume contracts."""
 
 import typing as t
+from types import SimpleNamespace
 
 import httpx
 import pytest
@@ -348,3 +349,116 @@ def test_decode_results_content_xai_maps_response_and_error_rows() -> None:
 
     assert xai_results["req-error"].status_code == 500
     assert xai_results["req-error"].json()["message"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_process_batch_reuses_one_client_for_upload_and_create() -> None:
+    """
+    Ensure file-based submission uploads and creates the batch on one client.
+    """
+    provider = OpenAIProvider()
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        if request.url.path == "/v1/files":
+            return httpx.Response(status_code=200, json={"id": "file-123"})
+        return httpx.Response(status_code=200, json={"id": "batch-123"})
+
+    opened_clients: list[httpx.AsyncClient] = []
+
+    def client_factory() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        opened_clients.append(client)
+        return client
+
+    request = SimpleNamespace(
+        custom_id="req-1",
+        params={
+            "url": "api.openai.com",
+            "method": "POST",
+            "endpoint": "/v1/chat/completions",
+            "headers": {"authorization": "Bearer token"},
+            "body": b'{"model":"gpt-4o-mini","messages":[]}',
+        },
+    )
+    submission = await provider.process_batch(
+        requests=[request],
+        client_factory=client_factory,
+        queue_key=("openai", "/v1/chat/completions", "gpt-4o-mini"),
+        completion_window="24h",
+    )
+
+    assert submission.batch_id == "batch-123"
+    assert seen_paths == ["/v1/files", "/v1/batches"]
+    assert len(opened_clients) == 1
+    assert opened_clients[0].is_closed
+
+
+@pytest.mark.parametrize(
+    ("provider", "status", "expected"),
+    [
+        (OpenAIProvider(), "completed", True),
+        (OpenAIProvider(), "in_progress", False),
+        (MistralProvider(), "SUCCESS", True),
+        (AnthropicProvider(), "ended", True),
+        (GroqProvider(), "expired", True),
+        (VertexProvider(), "JOB_STATE_RUNNING", False),
+    ],
+)
+def test_is_terminal_status_matches_declared_terminal_states(
+    provider: t.Any, status: str, expected: bool
+) -> None:
+    """
+    Ensure terminal status checks follow each provider's declared states.
+
+    Parameters
+    ----------
+    provider : typing.Any
+        Provider instance under test.
+    status : str
+        Polled status value.
+    expected : bool
+        Expected terminal flag.
+    """
+    assert provider.is_terminal_status(status=status) is expected
+
+
+def test_decode_results_content_scans_jsonl_lines() -> None:
+    """
+    Ensure JSONL decoding skips blank lines and only splits on ``\\n``.
+    """
+    provider = OpenAIProvider()
+    results = provider.decode_results_content(
+        batch_id="batch-123",
+        content=(
+            '{"custom_id":"a","response":{"status_code":200,"body":{"text":"x\u2028y"}}}\r\n'
+            "\n"
+            "   \n"
+            '{"custom_id":"b","response":{"status_code":201,"body":{}}}'
+        ),
+    )
+
+    assert set(results.keys()) == {"a", "b"}
+    assert results["a"].json() == {"text": "x\u2028y"}
+    assert results["b"].status_code == 201
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", [OpenAIProvider(), MistralProvider()])
+async def test_file_based_batch_payload_metadata_is_not_shared(provider: t.Any) -> None:
+    """
+    Ensure mutating one batch payload does not leak into later payloads.
+    """
+    payload_kwargs = {
+        "file_id": "file-1",
+        "endpoint": "/v1/chat/completions",
+        "queue_key": (provider.name, "/v1/chat/completions", "model-a"),
+        "completion_window": "24h",
+    }
+    first_payload = await provider.build_file_based_batch_payload(**payload_kwargs)
+    first_payload["metadata"]["description"] = "mutated"
+
+    second_payload = await provider.build_file_based_batch_payload(**payload_kwargs)
+
+    assert second_payload["metadata"] == {"description": "batchling runtime batch"}